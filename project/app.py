@@ -2,38 +2,25 @@
 # cyber risk assessment tool (uk charities)
 # author: aisha moussa
 
-import json
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+
 import streamlit as st
-import pandas as pd
-import altair as alt
 
 from ux import apply_styles, hero_card
-from questionnaire import QUESTIONNAIRE, DOMAIN_QUESTION_IDS, SCALE_LABELS
+from questionnaire import (
+    DOMAIN_QUESTION_IDS,
+    ALL_QUESTION_IDS,
+    SLIDER_LABELS,
+    QUESTION_DOMAINS,
+    SCALE,
+    SCALE_LABELS,
+)
 from charity_profile import default_charity_context
 from scoring import run_assessment
 
 
-# page setup
-# kept this simple and wide because the app has questionnaire, metrics, tables, and charts
-st.set_page_config(page_title="Cyber Risk Assessment Tool", layout="wide")
-apply_styles()
-hero_card()
-
-
-# streamlit reruns the script whenever widgets change,
-# so i used session state to stop results disappearing between interactions
-if "result" not in st.session_state:
-    st.session_state.result = None
-
-if "last_calculated" not in st.session_state:
-    st.session_state.last_calculated = None
-
-
-# splitting the app into tabs made the flow clearer:
-# assessment first, then results, then background/context
-tab1, tab2, tab3 = st.tabs(["Assessment", "Results", "About"])
-
-
 def build_ctx_from_state() -> dict:
     # this rebuilds the charity context from current widget values
     # so scoring always uses the latest impact inputs
@@ -48,6 +35,126 @@ def build_ctx_from_state() -> dict:
     return ctx_local
 
 
+# session state keys behind the charity context widgets
+CONTEXT_STATE_KEYS = ("charity_name", "data_sens", "ops_dep", "fin_exp", "rep_risk")
+
+
+def get_ctx() -> dict:
+    # the context only changes when one of its widgets does, so the built dict
+    # is kept in session state and only rebuilt when those values change
+    ctx_key = tuple(st.session_state.get(k) for k in CONTEXT_STATE_KEYS)
+    if st.session_state.get("_ctx_key") != ctx_key:
+        st.session_state.ctx_cache = build_ctx_from_state()
+        st.session_state._ctx_key = ctx_key
+    return st.session_state.ctx_cache
+
+
+def _freeze(d):
+    # dicts are turned into sorted tuples before they reach a cached function,
+    # so streamlit only has to hash a flat tuple of simple values
+    return tuple(sorted(d.items()))
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=256, show_spinner=False)
+def _cached_run(responses_tuple, ctx_tuple, dq_tuple):
+    # streamlit reruns the whole script a lot, so identical inputs are served
+    # from cache instead of re-scoring. tuples are used because they hash cheaply
+    return run_assessment(
+        responses=dict(responses_tuple),
+        domain_question_ids=dict(dq_tuple),
+        context=dict(ctx_tuple)
+    )
+
+
+# the key includes the calculation timestamp, so every calculate click in every session
+# makes a new entry - bounded by age and count so old ones are evicted
+@st.cache_data(ttl=24 * 60 * 60, max_entries=64, show_spinner=False)
+def _serialize_payload(payload_key, _payload):
+    # the export json only changes when a new result is calculated or the inputs
+    # behind it change, so it is keyed on those instead of re-encoding every rerun.
+    # _payload is skipped by streamlit's hashing (leading underscore).
+    # returns bytes so the download button doesn't have to re-encode a str
+    try:
+        # orjson is optional - it's a much faster C encoder if it's installed
+        import orjson
+    except ImportError:
+        import json
+        # ensure_ascii=False writes non-ascii text (e.g. "Café") as utf-8 like orjson does,
+        # so the export is byte-identical whichever encoder is available
+        return json.dumps(_payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+    return orjson.dumps(_payload, option=orjson.OPT_INDENT_2)
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=64, show_spinner=False)
+def _weakness_chart(weakness_items):
+    # the chart spec only depends on the (domain, weakness) pairs,
+    # so it is built once per distinct result and reused on later reruns
+    import pandas as pd
+    import altair as alt
+
+    chart_df = pd.DataFrame(weakness_items, columns=["Domain", "Weakness"])
+
+    return (
+        alt.Chart(chart_df)
+        .mark_bar()
+        .encode(
+            x=alt.X("Domain:N", sort="-y"),
+            y=alt.Y("Weakness:Q", scale=alt.Scale(domain=[0, 4])),
+            color=alt.Color(
+                "Weakness:Q",
+                scale=alt.Scale(
+                    domain=[0, 1.5, 2.5, 3.5, 4],
+                    range=["#16A34A", "#EAB308", "#F97316", "#B91C1C", "#7F1D1D"],
+                ),
+                legend=alt.Legend(title="Weakness"),
+            ),
+            tooltip=["Domain:N", "Weakness:Q"],
+        )
+    )
+
+
+# shared number format for the results tables (rendered client-side, no Styler)
+TWO_DP_COLUMN = st.column_config.NumberColumn(format="%.2f")
+
+# upper bound on rows sent to st.dataframe in one go.
+# the current tables are tiny, but this keeps the payload bounded if the questionnaire grows
+MAX_DISPLAY_ROWS = 200
+
+# frozen once so the cache key for the question mapping never has to be rebuilt
+DQ_FROZEN = tuple(DOMAIN_QUESTION_IDS.items())
+
+
+def show_dataframe(df, key, **kwargs):
+    # large tables are cut down for display, with the full data still downloadable
+    if len(df) > MAX_DISPLAY_ROWS:
+        st.warning(f"Showing the first {MAX_DISPLAY_ROWS} of {len(df)} rows. Download the CSV for the full table.")
+        st.dataframe(df.head(MAX_DISPLAY_ROWS), **kwargs)
+        st.download_button(
+            "Download full table (CSV)",
+            data=df.to_csv().encode("utf-8"),
+            file_name=f"{key}.csv",
+            mime="text/csv",
+            key=f"download_{key}"
+        )
+    else:
+        st.dataframe(df, **kwargs)
+
+
+def calculate_result():
+    # submit callback for the assessment form. streamlit commits the slider values
+    # to session state before calling it, so the score always matches what is on screen.
+    # main handoff into scoring.py
+    # keeping scoring outside app.py made the model easier to test and explain
+    responses = {qid: st.session_state[qid] for qid in ALL_QUESTION_IDS}
+    st.session_state.result = _cached_run(
+        _freeze(responses),
+        _freeze(get_ctx()),
+        DQ_FROZEN
+    )
+    st.session_state.last_calculated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
 def reset_assessment():
     # reset puts the app back into a clean starting state
     # useful when testing different scenarios without leftover values
@@ -59,112 +166,111 @@ def reset_assessment():
     st.session_state["ops_dep"] = default_ctx["operational_dependency"]
     st.session_state["rep_risk"] = default_ctx["reputational_risk"]
 
-    for domain, questions in QUESTIONNAIRE.items():
-        for q in questions:
-            st.session_state[q["id"]] = 0
+    for qid in ALL_QUESTION_IDS:
+        st.session_state[qid] = 0
 
     st.session_state["result"] = None
     st.session_state["last_calculated"] = None
 
 
-# rebuilding responses from session state means the scoring layer always gets
-# a clean question-id -> score mapping based on the latest slider values
-responses = {}
-for domain, questions in QUESTIONNAIRE.items():
-    for q in questions:
-        if q["id"] not in st.session_state:
-            # defaulting to 0 avoids inflated scores from unanswered items
-            st.session_state[q["id"]] = 0
-        responses[q["id"]] = st.session_state[q["id"]]
-
-
 # tab 1 = inputs only
 # i wanted the assessment stage to feel focused, not mixed with outputs
-with tab1:
+def render_assessment_tab():
     st.header("Assessment")
     st.caption("Tip: answer honestly. This is an indicative self-assessment, not a compliance audit.")
 
-    st.subheader("Charity context (Impact inputs)")
-    with st.container(border=True):
-        # context is separated from the questionnaire because impact is meant
-        # to capture charity-level consequence, not control maturity
-        ctx_preview = default_charity_context()
-
-        st.text_input("Charity name", value=ctx_preview["charity_name"], key="charity_name")
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.slider(
-                "Data sensitivity (0-4)",
-                0, 4, int(ctx_preview["data_sensitivity"]),
-                help="How sensitive is the data? (e.g., beneficiaries, donor details, finance)",
-                key="data_sens"
-            )
-            st.slider(
-                "Financial exposure (0-4)",
-                0, 4, int(ctx_preview["financial_exposure"]),
-                help="How much financial loss could result from an incident?",
-                key="fin_exp"
-            )
-        with c2:
-            st.slider(
-                "Operational dependency (0-4)",
-                0, 4, int(ctx_preview["operational_dependency"]),
-                help="How badly would disruption affect daily operations?",
-                key="ops_dep"
-            )
-            st.slider(
-                "Reputational risk (0-4)",
-                0, 4, int(ctx_preview["reputational_risk"]),
-                help="How damaging would loss of trust be (donors, community, regulators)?",
-                key="rep_risk"
-            )
+    # sliders live inside a form so dragging them does not rerun the whole script;
+    # values are only committed (and the risk score calculated) when the form is submitted
+    with st.form("assessment_form"):
+        st.subheader("Charity context (Impact inputs)")
+        with st.container(border=True):
+            # context is separated from the questionnaire because impact is meant
+            # to capture charity-level consequence, not control maturity
+            ctx_preview = default_charity_context()
+
+            st.text_input("Charity name", value=ctx_preview["charity_name"], key="charity_name")
+
+            c1, c2 = st.columns(2)
+            with c1:
+                st.slider(
+                    f"Data sensitivity ({SCALE})",
+                    0, 4, int(ctx_preview["data_sensitivity"]),
+                    help="How sensitive is the data? (e.g., beneficiaries, donor details, finance)",
+                    key="data_sens"
+                )
+                st.slider(
+                    f"Financial exposure ({SCALE})",
+                    0, 4, int(ctx_preview["financial_exposure"]),
+                    help="How much financial loss could result from an incident?",
+                    key="fin_exp"
+                )
+            with c2:
+                st.slider(
+                    f"Operational dependency ({SCALE})",
+                    0, 4, int(ctx_preview["operational_dependency"]),
+                    help="How badly would disruption affect daily operations?",
+                    key="ops_dep"
+                )
+                st.slider(
+                    f"Reputational risk ({SCALE})",
+                    0, 4, int(ctx_preview["reputational_risk"]),
+                    help="How damaging would loss of trust be (donors, community, regulators)?",
+                    key="rep_risk"
+                )
+
+        st.divider()
 
-    st.button("Reset assessment", on_click=reset_assessment)
+        st.subheader("Questionnaire (0 = not in place, 4 = fully in place)")
+        st.caption("Scores represent organisational maturity (not individual staff performance).")
 
-    st.divider()
+        with st.expander(f"What do the scores mean? ({SCALE})", expanded=False):
+            for k in range(0, 5):
+                st.write(f"**{k}** - {SCALE_LABELS[k]}")
 
-    st.subheader("Questionnaire (0 = not in place, 4 = fully in place)")
-    st.caption("Scores represent organisational maturity (not individual staff performance).")
+        questions = zip(QUESTION_DOMAINS, ALL_QUESTION_IDS, SLIDER_LABELS)
+        for domain, domain_questions in groupby(questions, key=itemgetter(0)):
+            # each domain is shown separately so the questionnaire feels less overwhelming
+            with st.expander(domain, expanded=True):
+                for _, qid, label in domain_questions:
+                    value = st.slider(
+                        label,
+                        0, 4,
+                        step=1,
+                        key=qid
+                    )
+                    # this updates on submit, so it shows the value the current result was built from
+                    st.caption(f"Applied: {value} - {SCALE_LABELS[value]}")
 
-    with st.expander("What do the scores mean? (0-4)", expanded=False):
-        for k in range(0, 5):
-            st.write(f"**{k}** - {SCALE_LABELS[k]}")
+        st.form_submit_button("Calculate risk score", on_click=calculate_result)
 
-    for domain, questions in QUESTIONNAIRE.items():
-        # each domain is shown separately so the questionnaire feels less overwhelming
-        with st.expander(domain, expanded=True):
-            for q in questions:
-                value = st.slider(
-                    f"{q['id']} - {q['question']}",
-                    0, 4,
-                    step=1,
-                    key=q["id"]
-                )
-                st.caption(f"Selected: {value} - {SCALE_LABELS[value]}")
+    if st.session_state.last_calculated:
+        st.success("Risk score calculated - see the Results tab. Changed answers apply when you calculate again.")
+
+    st.button("Reset assessment", on_click=reset_assessment)
 
 
 # tab 2 = outputs + interpretation
-with tab2:
+# this is a fragment so its own widgets (e.g. the download button) only rerun
+# the results tab, not the whole questionnaire and every widget above it
+@st.fragment
+def results_fragment(responses):
     st.header("Results")
 
-    ctx = build_ctx_from_state()
+    ctx = get_ctx()
 
-    if st.button("Calculate risk score", key="calc_risk"):
-        # main handoff into scoring.py
-        # keeping scoring outside app.py made the model easier to test and explain
-        st.session_state.result = run_assessment(
-            responses=responses,
-            domain_question_ids=DOMAIN_QUESTION_IDS,
-            context=ctx
-        )
-        st.session_state.last_calculated = pd.Timestamp.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    # frozen once here and reused as the cache key for the export
+    responses_key = _freeze(responses)
+    ctx_key = _freeze(ctx)
 
     result = st.session_state.result
 
     if result is None:
-        st.warning("Go to the Assessment tab, answer the questions, then click 'Calculate risk score'.")
+        st.warning("Go to the Assessment tab, answer the questions, then click 'Calculate risk score' at the bottom of the form.")
     else:
+        # only imported once there is something to show, so reruns that never
+        # reach the results view don't pay for loading pandas
+        import pandas as pd
+
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Risk band", result["risk_band"])
         col2.metric("Likelihood", result["likelihood"])
@@ -177,57 +283,52 @@ with tab2:
         st.subheader("Cyber risk exposure by domain (higher = weaker)")
         st.caption("This chart visualises weakness = 4 - maturity. Higher weakness contributes to higher likelihood.")
 
-        domain_df = pd.DataFrame.from_dict(
-            result["domain_scores"],
-            orient="index",
-            columns=["Maturity (0 - 4)"]
-        )
-        domain_df.index.name = "Domain"
-
         # converting maturity into weakness here makes the chart line up more clearly
-        # with how likelihood is actually calculated in scoring.py
-        weakness_df = domain_df.copy()
-        weakness_df["Weakness (0 - 4)"] = 4 - weakness_df["Maturity (0 - 4)"]
-        weakness_df = weakness_df[["Weakness (0 - 4)"]]
+        # with how likelihood is actually calculated in scoring.py.
+        # done once on a series so the table and chart share it (no copy/join)
+        maturity = pd.Series(result["domain_scores"], dtype=float)
+        weakness = 4 - maturity
 
-        chart_df = weakness_df.reset_index()
-        chart_df.columns = ["Domain", "Weakness"]
-
-        if chart_df["Weakness"].sum() == 0:
+        if weakness.sum() == 0:
             st.success("All domains are currently at maximum maturity. Weakness values are 0 across the assessment.")
         else:
             # i used a simple bar chart because it is quicker to read than a table,
             # especially for non-technical users trying to spot weak areas fast
-            chart = (
-                alt.Chart(chart_df)
-                .mark_bar()
-                .encode(
-                    x=alt.X("Domain:N", sort="-y"),
-                    y=alt.Y("Weakness:Q", scale=alt.Scale(domain=[0, 4])),
-                    color=alt.Color(
-                        "Weakness:Q",
-                        scale=alt.Scale(
-                            domain=[0, 1.5, 2.5, 3.5, 4],
-                            range=["#16A34A", "#EAB308", "#F97316", "#B91C1C", "#7F1D1D"],
-                        ),
-                        legend=alt.Legend(title="Weakness"),
-                    ),
-                    tooltip=["Domain:N", "Weakness:Q"],
-                )
-            )
-
-            st.altair_chart(chart, use_container_width=True)
+            weakness_items = tuple(zip(weakness.index, weakness.tolist()))
+            st.altair_chart(_weakness_chart(weakness_items), use_container_width=True)
 
         st.subheader("Domain maturity and weakness summary")
 
-        combined_df = domain_df.join(weakness_df)
-        st.dataframe(combined_df.style.format("{:.2f}"), use_container_width=True)
+        # pre-rounded instead of using Styler, which is slow to render in st.dataframe.
+        # the 2dp display is done by the frontend through column_config instead
+        combined_df = pd.DataFrame(
+            {"Maturity (0 - 4)": maturity, "Weakness (0 - 4)": weakness}
+        ).round(2)
+        combined_df.index.name = "Domain"
+        show_dataframe(
+            combined_df,
+            "domain_summary",
+            use_container_width=True,
+            column_config={
+                "Maturity (0 - 4)": TWO_DP_COLUMN,
+                "Weakness (0 - 4)": TWO_DP_COLUMN
+            }
+        )
 
         st.subheader("Weakest areas (priority order)")
-        weak_df = pd.DataFrame(result["weak_domain_ranking"], columns=["Domain", "Weakness (0 - 4)"])
-        weak_df.index = range(1, len(weak_df) + 1)
-        weak_df.index.name = "Priority"
-        st.dataframe(weak_df.style.format({"Weakness (0 - 4)": "{:.2f}"}), use_container_width=True)
+        # built straight from columns + a ready-made index,
+        # rather than inferring columns from a list of tuples and re-indexing after
+        ranked_domains, ranked_weakness = zip(*result["weak_domain_ranking"])
+        weak_df = pd.DataFrame(
+            {"Domain": ranked_domains, "Weakness (0 - 4)": ranked_weakness},
+            index=pd.RangeIndex(1, len(ranked_domains) + 1, name="Priority")
+        )
+        show_dataframe(
+            weak_df.round(2),
+            "weakest_areas",
+            use_container_width=True,
+            column_config={"Weakness (0 - 4)": TWO_DP_COLUMN}
+        )
 
         top_domain = weak_df.iloc[0]["Domain"]
         st.info(
@@ -264,7 +365,15 @@ with tab2:
         # beyond the screen, especially for review, comparison, or evidence
         st.download_button(
             "Download results (JSON)",
-            data=json.dumps(export_payload, indent=2),
+            data=_serialize_payload(
+                (
+                    result["risk_score"],
+                    st.session_state.last_calculated,
+                    ctx_key,
+                    responses_key
+                ),
+                export_payload
+            ),
             file_name="risk_assessment_result.json",
             mime="application/json",
             key="download_json"
@@ -272,7 +381,7 @@ with tab2:
 
 
 # tab 3 gives the user context of the purpose and what 5 my tool is about
-with tab3:
+def render_about_tab():
     st.header("About this tool")
     st.write(
         """
@@ -343,4 +452,44 @@ Future work could extend the tool by:
 - aggregating responses to highlight perception gaps and governance inconsistencies
 - strengthening automated testing and recommendation personalisation
 """
-    )
\ No newline at end of file
+    )
+
+
+def main():
+    # page setup
+    # kept this simple and wide because the app has questionnaire, metrics, tables, and charts
+    st.set_page_config(page_title="Cyber Risk Assessment Tool", layout="wide")
+    apply_styles()
+    hero_card()
+
+    # streamlit reruns the script whenever widgets change,
+    # so i used session state to stop results disappearing between interactions.
+    # everything is initialised in one go on the first run, then a single flag
+    # check is all later reruns pay
+    if "_init_done" not in st.session_state:
+        # defaulting to 0 avoids inflated scores from unanswered items
+        st.session_state.update({qid: 0 for qid in ALL_QUESTION_IDS})
+        st.session_state.result = None
+        st.session_state.last_calculated = None
+        st.session_state._init_done = True
+
+    # rebuilding responses from session state means the scoring layer always gets
+    # a clean question-id -> score mapping based on the latest slider values
+    responses = {qid: st.session_state[qid] for qid in ALL_QUESTION_IDS}
+
+    # splitting the app into tabs made the flow clearer:
+    # assessment first, then results, then background/context
+    tab1, tab2, tab3 = st.tabs(["Assessment", "Results", "About"])
+
+    with tab1:
+        render_assessment_tab()
+
+    with tab2:
+        results_fragment(responses)
+
+    with tab3:
+        render_about_tab()
+
+
+if __name__ == "__main__":
+    main()
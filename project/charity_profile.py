@@ -1,14 +1,22 @@
 # charity_profile.py
 # defines the default charity context values used to estimate impact
 
+from types import MappingProxyType
+
+
+# kept these factors simple so impact reflects what actually affects small charities most:
+# sensitive data, reliance on systems, money, and reputation
+
+# frozen at module level, because the app asks for defaults on every rerun
+_DEFAULT_CONTEXT = MappingProxyType({
+    "charity_name": "",
+    "data_sensitivity": 0,   # defaults are set to 0 so the user must actively choose values
+    "operational_dependency": 0, # it helps avoide inflated risk scores from assumptions
+    "financial_exposure": 0,
+    "reputational_risk": 0,
+})
+
+
 def default_charity_context():
-    # kept these factors simple so impact reflects what actually affects small charities most:
-    # sensitive data, reliance on systems, money, and reputation
-
-    return {
-        "charity_name": "",
-        "data_sensitivity": 0,   # defaults are set to 0 so the user must actively choose values             
-        "operational_dependency": 0, # it helps avoide inflated risk scores from assumptions
-        "financial_exposure": 0,
-        "reputational_risk": 0,
-    }
\ No newline at end of file
+    # callers fill this in with slider values, so they get their own copy
+    return dict(_DEFAULT_CONTEXT)
@@ -3,6 +3,8 @@
 # uses JSON for lightweight storage and exporting results
 
 import json
+import os
+from functools import lru_cache
 
 
 def save_json(filepath, data):
@@ -11,10 +13,23 @@ def save_json(filepath, data):
         json.dump(data, f, indent=2)
 
 def load_json(filepath):
+    # the file's modified time is part of the cache key,
+    # so a file that has been re-saved is read again instead of served stale
+    return _cached_reader()(filepath, os.path.getmtime(filepath))
+
+
+def _read_json(filepath, mtime):
+    # mtime is only there to be part of the cache key
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
-    
-
 
 
+@lru_cache(maxsize=1)
+def _cached_reader():
+    # streamlit is only imported the first time something is loaded,
+    # so this module can still be imported without it (same as ux.py).
+    # cache_data hands back a copy each time, so callers can't mutate the cached result,
+    # and old mtimes age out instead of piling up
+    import streamlit as st
 
+    return st.cache_data(ttl=24 * 60 * 60, max_entries=32, show_spinner=False)(_read_json)
@@ -6,40 +6,53 @@
 # i kept the scoring logic separate from the streamlit app so it could be
 # tested independently and changed without breaking the ui
 
+import heapq
+from bisect import bisect_right
+from operator import itemgetter
+from types import MappingProxyType
+
 MAX_SCORE = 4
 LOW_RISK_THRESHOLD = 4
 MEDIUM_RISK_THRESHOLD = 9
 TOP_WEAK_DOMAINS = 2
 
 # current thresholds are intentionally simple for interpretability in the prototype version
+RISK_BAND_THRESHOLDS = (LOW_RISK_THRESHOLD, MEDIUM_RISK_THRESHOLD)
+RISK_BANDS = ("Low", "Medium", "High")
+
+# charity context fields that make up impact (see charity_profile.py)
+IMPACT_FACTORS = ("data_sensitivity", "operational_dependency", "financial_exposure", "reputational_risk")
+_get_impact_factors = itemgetter(*IMPACT_FACTORS)
 
-DOMAIN_RECOMMENDATIONS = {
-    "Identify": [
+# read-only and stored as tuples, so every result can share the same
+# recommendation text by reference without one caller being able to change it for the rest
+DOMAIN_RECOMMENDATIONS = MappingProxyType({
+    "Identify": (
         "Create and maintain a simple inventory of charity devices, accounts, systems, and sensitive data such as donor, beneficiary, and finance records.",
         "Define who is responsible for cyber-risk oversight and review which staff or volunteers can access important systems and data.",
         "Document where charity information is stored and whether personal devices or third-party accounts are being used to access it."
-    ],
-    "Protect": [
+    ),
+    "Protect": (
         "Strengthen access security by enabling multi-factor authentication on email, cloud storage, and other important charity systems where possible.",
         "Apply clear password and account management rules, including unique accounts, appropriate permissions, and regular access review.",
         "Provide short, practical phishing-awareness guidance for staff and volunteers, especially where donor or financial data is handled."
-    ],
-    "Detect": [
+    ),
+    "Detect": (
         "Enable basic alerts and monitoring for important accounts, particularly email and cloud platforms used for charity operations.",
         "Define simple checks for suspicious activity, such as reviewing unusual logins, verifying messages, and resetting compromised accounts.",
         "Ensure there is a clear reporting route so staff and volunteers know how to raise suspected cyber-security concerns quickly."
-    ],
-    "Respond": [
+    ),
+    "Respond": (
         "Create a short incident response checklist covering common scenarios such as phishing, account compromise, and data loss.",
         "Assign a named person or role to coordinate incident handling, escalation, and communication during a cyber event.",
         "Keep a basic incident record of what happened, what actions were taken, and what follow-up improvements are needed."
-    ],
-    "Recover": [
+    ),
+    "Recover": (
         "Ensure important charity data is backed up and that backup access is understood before an incident occurs.",
         "Define how key services such as email, donor systems, or finance records would be restored after disruption.",
         "Review incidents and near-misses to identify lessons learned, update responsibilities, and improve future recovery readiness."
-    ]
-}
+    )
+})
 
 
 def calculate_domain_scores(responses, domain_question_ids):
@@ -50,8 +63,9 @@ def calculate_domain_scores(responses, domain_question_ids):
     # treating every question as a separate result
     domain_scores = {}
     for domain, qids in domain_question_ids.items():
-        scores = [responses[qid] for qid in qids]
-        domain_scores[domain] = round(sum(scores) / len(scores), 2)
+        # map + sum keeps the per-question lookups in C instead of building a list first
+        total = sum(map(responses.__getitem__, qids))
+        domain_scores[domain] = total / len(qids)
     return domain_scores
 
 
@@ -61,19 +75,19 @@ def calculate_likelihood(domain_scores, domain_weights=None):
     """
     # for this prototype i kept weights optional because equal weighting keeps
     # the model simple + easier to explain, but it could be extended later
+    # lower maturity should increase likelihood, so i invert it into weakness
     if domain_weights is None:
-        domain_weights = {d: 1 for d in domain_scores.keys()}
-
-    total_weight = sum(domain_weights.values())
-    weighted_weakness = 0
-
-    for domain, maturity in domain_scores.items():
-        # lower maturity should increase likelihood, so i invert it into weakness
-        weakness = MAX_SCORE - maturity
-        weighted_weakness += weakness * domain_weights.get(domain, 1)
+        # equal weights of 1 make this the plain mean weakness,
+        # so there's no need to build a weights dict on every call
+        weakness_total = sum(MAX_SCORE - maturity for maturity in domain_scores.values())
+        return weakness_total / len(domain_scores)
 
-    likelihood = weighted_weakness / total_weight
-    return round(likelihood, 2)
+    # weighted mean of weakness in a single sum() pass
+    weighted_weakness = sum(
+        (MAX_SCORE - maturity) * domain_weights.get(domain, 1)
+        for domain, maturity in domain_scores.items()
+    )
+    return weighted_weakness / sum(domain_weights.values())
 
 
 def calculate_impact(context):
@@ -82,14 +96,8 @@ def calculate_impact(context):
     """
     # impact is kept separate because two charities can have similar gaps
     # but very different consequences if something goes wrong
-    factors = [
-        context["data_sensitivity"],
-        context["operational_dependency"],
-        context["financial_exposure"],
-        context["reputational_risk"]
-    ]
-    impact = sum(factors) / len(factors)
-    return round(impact, 2)
+    # all four factors are pulled out of the context in one itemgetter call
+    return sum(_get_impact_factors(context)) / len(IMPACT_FACTORS)
 
 
 def calculate_risk(likelihood, impact):
@@ -98,40 +106,55 @@ def calculate_risk(likelihood, impact):
     """
     # simplified version of nist sp 800-30:
     # not full threat modelling, but enough for a usable prototype
-    return round(likelihood * impact, 2)
+    return likelihood * impact
 
 
 def risk_band(risk_score):
     """
     Categorises risk into bands.
     """
-    # bands make results easier to understand in the ui
-    if risk_score < LOW_RISK_THRESHOLD:
-        return "Low"
-    elif risk_score < MEDIUM_RISK_THRESHOLD:
-        return "Medium"
-    return "High"
+    # bands make results easier to understand in the ui.
+    # bisect_right means a score equal to a threshold falls into the band above it
+    return RISK_BANDS[bisect_right(RISK_BAND_THRESHOLDS, risk_score)]
+
+
+def _domain_weaknesses(domain_scores):
+    # weakness is just the inverse of maturity, in the same order as domain_scores.
+    # rounded here (the one place every ranking goes through) so the ranking,
+    # the 0.5 cut-off for recommendations and the displayed values all agree
+    return [(domain, round(MAX_SCORE - score, 2)) for domain, score in domain_scores.items()]
 
 
 def rank_weak_domains(domain_scores):
     """
     Sorts domains by weakness (worst first).
     """
-    weaknesses = []
-    for domain, score in domain_scores.items():
-        weaknesses.append((domain, round(MAX_SCORE - score, 2)))
+    weaknesses = _domain_weaknesses(domain_scores)
 
     # sorting worst-first helps prioritise action
-    weaknesses.sort(key=lambda x: x[1], reverse=True)
+    weaknesses.sort(key=itemgetter(1), reverse=True)
     return weaknesses
 
 
+def top_weak_domains(domain_scores, k=TOP_WEAK_DOMAINS):
+    """
+    Returns only the k weakest domains (worst first).
+    """
+    # when only the top few are needed there's no point sorting every domain.
+    # nlargest keeps the same tie order as the full sort
+    return heapq.nlargest(k, _domain_weaknesses(domain_scores), key=itemgetter(1))
+
+
 def generate_recommendations(domain_scores):
     """
     Generate recommendations based on weakest domains.
     """
-    ranked = rank_weak_domains(domain_scores)
+    return _recommendations_from_ranking(top_weak_domains(domain_scores))
 
+
+def _recommendations_from_ranking(ranked):
+    # split out so run_assessment can reuse the ranking it already has
+    # instead of ranking the domains a second time
     if not ranked:
         return []
 
@@ -149,29 +172,51 @@ def generate_recommendations(domain_scores):
             "priority": priority,
             "domain": domain,
             "weakness": weakness,
-            "recommendations": DOMAIN_RECOMMENDATIONS.get(domain, [])
+            "recommendations": DOMAIN_RECOMMENDATIONS.get(domain, ())
         })
 
     return grouped_recommendations
 
 
+def _validate_responses(responses, domain_question_ids):
+    # checked once up front so a missing answer gives a clear error here,
+    # instead of a bare KeyError from deep inside the domain averaging
+    missing = [
+        qid
+        for qids in domain_question_ids.values()
+        for qid in qids
+        if qid not in responses
+    ]
+    if missing:
+        raise ValueError(f"Missing responses for question(s): {', '.join(missing)}")
+
+
 def run_assessment(responses, domain_question_ids, context, domain_weights=None):
     """
     Main scoring pipeline used by the app.
     """
     # keeping one main function made it easier to plug into streamlit
     # and also easier to test the full flow with pytest
+    _validate_responses(responses, domain_question_ids)
+
     domain_scores = calculate_domain_scores(responses, domain_question_ids)
     likelihood = calculate_likelihood(domain_scores, domain_weights=domain_weights)
     impact = calculate_impact(context)
     risk = calculate_risk(likelihood, impact)
 
+    # the scoring steps work at full precision and everything is rounded once here,
+    # so risk isn't calculated from already-rounded likelihood/impact values.
+    # the band uses the rounded score so it matches what is displayed
+    # (weaknesses are already rounded by rank_weak_domains)
+    risk_score = round(risk, 2)
+    ranked = rank_weak_domains(domain_scores)
+
     return {
-        "domain_scores": domain_scores,
-        "likelihood": likelihood,
-        "impact": impact,
-        "risk_score": risk,
-        "risk_band": risk_band(risk),
-        "weak_domain_ranking": rank_weak_domains(domain_scores),
-        "recommendations": generate_recommendations(domain_scores)
-    }
\ No newline at end of file
+        "domain_scores": {domain: round(score, 2) for domain, score in domain_scores.items()},
+        "likelihood": round(likelihood, 2),
+        "impact": round(impact, 2),
+        "risk_score": risk_score,
+        "risk_band": risk_band(risk_score),
+        "weak_domain_ranking": ranked,
+        "recommendations": _recommendations_from_ranking(ranked)
+    }
@@ -7,6 +7,7 @@ from scoring import (
     calculate_risk,
     risk_band,
     rank_weak_domains,
+    top_weak_domains,
     generate_recommendations,
     run_assessment,
 )
@@ -85,6 +86,14 @@ def test_risk_band_high():
     assert risk_band(12) == "High"
 
 
+def test_risk_band_boundaries():
+    # a score exactly on a threshold belongs to the higher band
+    assert risk_band(3.99) == "Low"
+    assert risk_band(4) == "Medium"
+    assert risk_band(8.99) == "Medium"
+    assert risk_band(9) == "High"
+
+
 def test_rank_weak_domains():
     domain_scores = {
         "Identify": 4,
@@ -98,6 +107,23 @@ def test_rank_weak_domains():
     assert ranked[0][1] == 3.0
 
 
+def test_top_weak_domains_matches_full_ranking():
+    # the top-k shortcut should give the same answer as the full ranking,
+    # including keeping tied domains in their original order
+    domain_scores = {
+        "Identify": 4,
+        "Protect": 1,
+        "Detect": 1,
+        "Respond": 3,
+        "Recover": 2,
+    }
+
+    top = top_weak_domains(domain_scores, k=2)
+
+    assert top == rank_weak_domains(domain_scores)[:2]
+    assert top == [("Protect", 3.0), ("Detect", 3.0)]
+
+
 def test_generate_recommendations_returns_output():
     domain_scores = {
         "Identify": 4,
@@ -206,4 +232,106 @@ def test_run_assessment_with_balanced_inputs():
     assert result["likelihood"] == 0.0
     assert result["impact"] == 1.0
     assert result["risk_score"] == 0.0
-    assert result["risk_band"] == "Low"
\ No newline at end of file
+    assert result["risk_band"] == "Low"
+
+
+def test_run_assessment_recommendations_follow_ranking():
+    # run_assessment ranks the domains once and reuses it for recommendations,
+    # so the recommended domains should always be the top of the ranking
+    responses = {
+        "ID1": 4, "ID2": 4, "ID3": 4, "ID4": 4,
+        "PR1": 0, "PR2": 1, "PR3": 0, "PR4": 1,
+        "DE1": 2, "DE2": 1, "DE3": 2, "DE4": 1,
+        "RS1": 3, "RS2": 3, "RS3": 3, "RS4": 3,
+        "RC1": 4, "RC2": 3, "RC3": 4, "RC4": 3,
+    }
+
+    domain_question_ids = {
+        "Identify": ["ID1", "ID2", "ID3", "ID4"],
+        "Protect": ["PR1", "PR2", "PR3", "PR4"],
+        "Detect": ["DE1", "DE2", "DE3", "DE4"],
+        "Respond": ["RS1", "RS2", "RS3", "RS4"],
+        "Recover": ["RC1", "RC2", "RC3", "RC4"],
+    }
+
+    context = {
+        "charity_name": "Ranking Charity",
+        "data_sensitivity": 2,
+        "operational_dependency": 2,
+        "financial_exposure": 2,
+        "reputational_risk": 2,
+    }
+
+    result = run_assessment(responses, domain_question_ids, context)
+
+    ranked_domains = [domain for domain, _ in result["weak_domain_ranking"]]
+    recommended_domains = [item["domain"] for item in result["recommendations"]]
+
+    assert len(result["weak_domain_ranking"]) == 5
+    assert recommended_domains == ranked_domains[:2] == ["Protect", "Detect"]
+
+
+def test_run_assessment_rounds_outputs_once():
+    # individual steps keep full precision; run_assessment rounds the final outputs
+    responses = {"Q1": 2, "Q2": 2, "Q3": 3}
+    domain_question_ids = {"Identify": ["Q1", "Q2", "Q3"]}
+    context = {
+        "charity_name": "Rounding Charity",
+        "data_sensitivity": 3,
+        "operational_dependency": 2,
+        "financial_exposure": 2,
+        "reputational_risk": 2,
+    }
+
+    assert calculate_domain_scores(responses, domain_question_ids)["Identify"] == 7 / 3
+
+    result = run_assessment(responses, domain_question_ids, context)
+
+    assert result["domain_scores"]["Identify"] == 2.33
+    assert result["likelihood"] == 1.67
+    assert result["impact"] == 2.25
+    # (4 - 7/3) * 2.25 = 3.75 exactly, which would be 3.76 if rounded inputs were multiplied
+    assert result["risk_score"] == 3.75
+    assert result["weak_domain_ranking"] == [("Identify", 1.67)]
+
+
+
+def test_generate_recommendations_matches_run_assessment():
+    # both paths round weakness in the same place, so they should agree
+    # on the 0.5 cut-off and on the reported weakness, even off the 0.25 grid
+    responses = {"Q1": 2, "Q2": 2, "Q3": 3, "Q4": 3, "Q5": 4, "Q6": 4}
+    domain_question_ids = {"Identify": ["Q1", "Q2", "Q3"], "Protect": ["Q4", "Q5", "Q6"]}
+    context = {
+        "charity_name": "Matching Charity",
+        "data_sensitivity": 2,
+        "operational_dependency": 2,
+        "financial_exposure": 2,
+        "reputational_risk": 2,
+    }
+
+    domain_scores = calculate_domain_scores(responses, domain_question_ids)
+    recs = generate_recommendations(domain_scores)
+
+    assert recs == run_assessment(responses, domain_question_ids, context)["recommendations"]
+    assert [(item["domain"], item["weakness"]) for item in recs] == [("Identify", 1.67), ("Protect", 0.33)]
+
+
+def test_weak_domain_helpers_round_weakness():
+    # the public helpers return 2dp weaknesses and apply the 0.5 cut-off to them
+    assert rank_weak_domains({"Identify": 7 / 3}) == [("Identify", 1.67)]
+    assert generate_recommendations({"Identify": 3.496, "Protect": 3.6}) == []
+
+def test_run_assessment_rejects_missing_responses():
+    # a missing answer should fail clearly at the start of the pipeline
+    responses = {"Q1": 4}
+    domain_question_ids = {"Identify": ["Q1", "Q2"], "Protect": ["Q3"]}
+    context = {
+        "charity_name": "Incomplete Charity",
+        "data_sensitivity": 2,
+        "operational_dependency": 2,
+        "financial_exposure": 2,
+        "reputational_risk": 2,
+    }
+
+    with pytest.raises(ValueError, match="Q2, Q3"):
+        run_assessment(responses, domain_question_ids, context)
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ux import weakness_color, weakness_label
+
+# these tests cover the pure colour/label helpers only,
+# the streamlit rendering functions are left to manual checks in the app
+
+
+@pytest.mark.parametrize(
+    "weakness, label, color",
+    [
+        (0, "Low", "#16A34A"),
+        (1.49, "Low", "#16A34A"),
+        (1.5, "Moderate", "#EAB308"),
+        (2.49, "Moderate", "#EAB308"),
+        (2.5, "High", "#F97316"),
+        (3.49, "High", "#F97316"),
+        (3.5, "Critical", "#E42121"),
+        (4, "Critical", "#E42121"),
+    ],
+)
+def test_weakness_bands_at_boundaries(weakness, label, color):
+    # a score exactly on a boundary belongs to the band above it
+    assert weakness_label(weakness) == label
+    assert weakness_color(weakness) == color
+
+
+def test_weakness_helpers_accept_numpy_scalars():
+    # app.py works with pandas series, so values can arrive as numpy floats
+    assert weakness_label(np.float64(3.8)) == "Critical"
+    assert weakness_color(np.float64(1.5)) == "#EAB308"
+    assert weakness_label(pd.Series([2.6]).iloc[0]) == "High"
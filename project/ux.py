@@ -7,7 +7,10 @@
 # - Holds colour logic for weakness (0–4)
 # - Gives me small reusable UI helpers (hero card + badge)
 
-import streamlit as st
+import re
+
+# streamlit is imported inside the functions that render something,
+# so the colour/label/html helpers can be used (and tested) without loading it
 
 
 CSS = """
@@ -41,28 +44,60 @@ CSS = """
 """
 
 
+HERO_HTML = """
+<div class="card">
+  <div style="display:flex; justify-content:space-between; align-items:flex-start; gap:14px;">
+    <div>
+      <div style="font-size:2.2rem; font-weight:900; line-height:1.1;">
+        Cyber Risk Assessment Tool (UK Charities)
+      </div>
+      <p class="muted" style="margin-top:8px;">
+        A lightweight cyber-risk self-assessment tool that helps charities prioritise security improvements using structured scoring and practical recommendations.
+      </p>
+    </div>
+    <div style="font-size:38px;"> </div>
+  </div>
+</div>
+"""
+
+# both blocks are sent on every rerun, so the whitespace is collapsed once at import
+# to keep the payload small (single-line html blocks also render fine in markdown)
+_CSS_MIN = re.sub(r"\s+", " ", CSS).strip()
+_HERO_HTML = re.sub(r"\s+", " ", HERO_HTML).strip()
+
+
 def apply_styles():
-    """Inject global CSS once at the top of the app."""
-    st.markdown(CSS, unsafe_allow_html=True)
+    """
+    Inject global CSS at the top of the app.
+    This has to run on every rerun: Streamlit clears any element a run doesn't
+    re-emit, so skipping it after the first run would drop the styles.
+    """
+    import streamlit as st
+
+    st.markdown(_CSS_MIN, unsafe_allow_html=True)
 
 
 def hero_card():
     """Simple header card so the app feels warmer + more 'charity-friendly'."""
-    st.markdown("""
-    <div class="card">
-      <div style="display:flex; justify-content:space-between; align-items:flex-start; gap:14px;">
-        <div>
-          <div style="font-size:2.2rem; font-weight:900; line-height:1.1;">
-            Cyber Risk Assessment Tool (UK Charities)
-          </div>
-          <p class="muted" style="margin-top:8px;">
-            A lightweight cyber-risk self-assessment tool that helps charities prioritise security improvements using structured scoring and practical recommendations.
-          </p>
-        </div>
-        <div style="font-size:38px;"> </div>
-      </div>
-    </div>
-    """, unsafe_allow_html=True)
+    import streamlit as st
+
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
+
+
+# weakness bands, lowest first: (label, colour)
+_WEAKNESS_BANDS = (
+    ("Low", "#16A34A"),       # green
+    ("Moderate", "#EAB308"),  # yellow
+    ("High", "#F97316"),      # orange
+    ("Critical", "#E42121"),  #  red
+)
+
+
+def _weakness_band(v: float) -> tuple:
+    """Pick the band for a weakness score (each threshold reached adds 1 to the index)."""
+    # int() matters: for numpy/pandas scalars the comparisons give numpy bools,
+    # and adding those is a logical OR rather than a count
+    return _WEAKNESS_BANDS[int(v >= 1.5) + int(v >= 2.5) + int(v >= 3.5)]
 
 
 def weakness_color(v: float) -> str:
@@ -70,23 +105,27 @@ def weakness_color(v: float) -> str:
     Map weakness score (0..4) to a friendly risk colour.
     Higher weakness = worse = warmer colour.
     """
-    if v >= 3.5: return "#E42121"  #  red
-    if v >= 2.5: return "#F97316"  # orange
-    if v >= 1.5: return "#EAB308"  # yellow
-    return "#16A34A"               # green
+    return _weakness_band(v)[1]
 
 
 def weakness_label(v: float) -> str:
     """Human label for weakness banding."""
-    if v >= 3.5: return "Critical"
-    if v >= 2.5: return "High"
-    if v >= 1.5: return "Moderate"
-    return "Low"
+    return _weakness_band(v)[0]
+
+
+_BADGE_TPL = "<span class='badge' style='background:{color}15; color:{color};'>{text}</span>".format
+
+
+def badges_html(items) -> str:
+    """
+    HTML for several (text, colour) badges joined together,
+    so a row of badges can go out in a single st.markdown call.
+    """
+    return " ".join(_BADGE_TPL(text=text, color=color) for text, color in items)
 
 
 def badge(text: str, color: str):
     """Small coloured badge (used under sliders / in results)."""
-    st.markdown(
-        f"<span class='badge' style='background:{color}15; color:{color};'>{text}</span>",
-        unsafe_allow_html=True
-    )
+    import streamlit as st
+
+    st.markdown(badges_html(((text, color),)), unsafe_allow_html=True)